@@ -486,6 +486,8 @@ class HasFollowupJobs:
 class SupportsReadableRelation(Protocol):
     """A readable relation retrieved from a destination that supports it"""
 
+    __slots__ = ()
+
     columns_schema: TTableSchemaColumns
     """Known dlt table columns for this relation"""
 
@@ -577,6 +579,8 @@ class DBApiCursor(SupportsReadableRelation):
 class SupportsReadableDataset(Protocol):
     """A readable dataset retrieved from a destination, has support for creating readable relations for a query or table"""
 
+    __slots__ = ()
+
     @property
     def schema(self) -> Schema: ...
 
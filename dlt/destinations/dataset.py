@@ -1,5 +1,19 @@
-from typing import Any, Generator, Sequence, Union, TYPE_CHECKING, Tuple
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+    Tuple,
+)
 
+import queue
+import threading
 from contextlib import contextmanager
 
 from dlt import version
@@ -10,6 +24,8 @@ from dlt.common.destination.reference import (
     SupportsReadableRelation,
     SupportsReadableDataset,
     TDatasetType,
+    DataFrame,
+    ArrowTable,
     TDestinationReferenceArg,
     Destination,
     JobClientBase,
@@ -33,6 +49,12 @@ if TYPE_CHECKING:
 else:
     IbisBackend = Any
 
+# relation methods that fetch the whole result while the cursor is open
+TRelationFetchMethod = Literal["df", "arrow", "fetchall", "fetchmany", "fetchone"]
+
+# marks the end of tables fetched by `ReadableDBAPIRelation.iter_arrow_prefetch`
+_PREFETCH_DONE = object()
+
 
 class DatasetException(DltException):
     pass
@@ -47,6 +69,12 @@ class ReadableRelationHasQueryException(DatasetException):
         super().__init__(msg)
 
 
+class ReadableRelationDatasetMismatchException(DatasetException):
+    def __init__(self) -> None:
+        msg = "Only relations created from this dataset can be fetched over its connection."
+        super().__init__(msg)
+
+
 class ReadableRelationUnknownColumnException(DatasetException):
     def __init__(self, column_name: str) -> None:
         msg = (
@@ -56,6 +84,18 @@ class ReadableRelationUnknownColumnException(DatasetException):
 
 
 class ReadableDBAPIRelation(SupportsReadableRelation):
+    __slots__ = (
+        "_dataset",
+        "_provided_query",
+        "_table_name",
+        "_limit",
+        "_selected_columns",
+        "_query_cache",
+        "_columns_schema_cache",
+        "_normalized_table",
+        "_normalized_selected",
+    )
+
     def __init__(
         self,
         *,
@@ -79,16 +119,18 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
         self._limit = limit
         self._selected_columns = selected_columns
 
-        # wire protocol functions
-        self.df = self._wrap_func("df")  # type: ignore
-        self.arrow = self._wrap_func("arrow")  # type: ignore
-        self.fetchall = self._wrap_func("fetchall")  # type: ignore
-        self.fetchmany = self._wrap_func("fetchmany")  # type: ignore
-        self.fetchone = self._wrap_func("fetchone")  # type: ignore
+        # the relation does not change after creation so the query is built only once
+        self._query_cache: Optional[str] = None
 
-        self.iter_df = self._wrap_iter("iter_df")  # type: ignore
-        self.iter_arrow = self._wrap_iter("iter_arrow")  # type: ignore
-        self.iter_fetch = self._wrap_iter("iter_fetch")  # type: ignore
+        # computed columns schema, kept once the table is known in the schema
+        self._columns_schema_cache: Optional[TTableSchemaColumns] = None
+
+        # table and column names normalized with the schema naming convention
+        self._normalized_table: Optional[str] = None
+        self._normalized_selected: Tuple[str, ...] = ()
+        # normalize now if schema is already resolved, otherwise on first use
+        if table_name and readable_dataset._schema:
+            self._normalize_identifiers()
 
     @property
     def sql_client(self) -> SqlClientBase[Any]:
@@ -104,9 +146,24 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
         if self._provided_query:
             return self._provided_query
 
-        table_name = self.sql_client.make_qualified_table_name(
-            self.schema.naming.normalize_tables_path(self._table_name)
-        )
+        if self._query_cache is None:
+            self._query_cache = self._build_query()
+        return self._query_cache
+
+    def _normalize_identifiers(self) -> None:
+        naming = self.schema.naming
+        self._normalized_table = naming.normalize_tables_path(self._table_name)
+        if self._selected_columns:
+            self._normalized_selected = tuple(
+                naming.normalize_path(c) for c in self._selected_columns
+            )
+        else:
+            self._normalized_selected = ()
+
+    def _build_query(self) -> str:
+        if self._normalized_table is None:
+            self._normalize_identifiers()
+        table_name = self.sql_client.make_qualified_table_name(self._normalized_table)
 
         maybe_limit_clause_1 = ""
         maybe_limit_clause_2 = ""
@@ -116,19 +173,17 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
             )
 
         selector = "*"
-        if self._selected_columns:
-            selector = ",".join(
-                [
-                    self.sql_client.escape_column_name(self.schema.naming.normalize_path(c))
-                    for c in self._selected_columns
-                ]
-            )
+        if self._normalized_selected:
+            selector = ",".join(map(self.sql_client.escape_column_name, self._normalized_selected))
 
         return f"SELECT {maybe_limit_clause_1} {selector} FROM {table_name} {maybe_limit_clause_2}"
 
     @property
     def columns_schema(self) -> TTableSchemaColumns:
-        return self.compute_columns_schema()
+        # NOTE: tables missing from the schema are not cached, they may appear after a load
+        if self._columns_schema_cache is None:
+            self._columns_schema_cache = self.compute_columns_schema()
+        return self._columns_schema_cache
 
     @columns_schema.setter
     def columns_schema(self, new_value: TTableSchemaColumns) -> None:
@@ -137,19 +192,21 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
     def compute_columns_schema(self) -> TTableSchemaColumns:
         """provide schema columns for the cursor, may be filtered by selected columns"""
 
-        columns_schema = (
-            self.schema.tables.get(self._table_name, {}).get("columns", {}) if self.schema else {}
-        )
+        if not self._table_name:
+            return None
+        if self._normalized_table is None:
+            self._normalize_identifiers()
+
+        columns_schema = self.schema.tables.get(self._normalized_table, {}).get("columns", {})
 
         if not columns_schema:
             return None
-        if not self._selected_columns:
+        if not self._normalized_selected:
             return columns_schema
 
         filtered_columns: TTableSchemaColumns = {}
-        for sc in self._selected_columns:
-            sc = self.schema.naming.normalize_path(sc)
-            if sc not in columns_schema.keys():
+        for sc in self._normalized_selected:
+            if sc not in columns_schema:
                 raise ReadableRelationUnknownColumnException(sc)
             filtered_columns[sc] = columns_schema[sc]
 
@@ -158,34 +215,105 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
     @contextmanager
     def cursor(self) -> Generator[SupportsReadableRelation, Any, Any]:
         """Gets a DBApiCursor for the current relation"""
-        with self.sql_client as client:
-            # this hacky code is needed for mssql to disable autocommit, read iterators
-            # will not work otherwise. in the future we should be able to create a readony
-            # client which will do this automatically
-            if hasattr(self.sql_client, "_conn") and hasattr(self.sql_client._conn, "autocommit"):
-                self.sql_client._conn.autocommit = False
+        with self._dataset._acquire_client() as client:
+            self._dataset._disable_autocommit(client)
             with client.execute_query(self.query) as cursor:
                 if columns_schema := self.columns_schema:
                     cursor.columns_schema = columns_schema
                 yield cursor
 
-    def _wrap_iter(self, func_name: str) -> Any:
-        """wrap SupportsReadableRelation generators in cursor context"""
-
-        def _wrap(*args: Any, **kwargs: Any) -> Any:
-            with self.cursor() as cursor:
-                yield from getattr(cursor, func_name)(*args, **kwargs)
-
-        return _wrap
-
-    def _wrap_func(self, func_name: str) -> Any:
-        """wrap SupportsReadableRelation functions in cursor context"""
-
-        def _wrap(*args: Any, **kwargs: Any) -> Any:
-            with self.cursor() as cursor:
-                return getattr(cursor, func_name)(*args, **kwargs)
-
-        return _wrap
+    # wire protocol functions, each executed in its own cursor context
+    def df(self, *args: Any, **kwargs: Any) -> Optional[DataFrame]:
+        with self.cursor() as cursor:
+            return cursor.df(*args, **kwargs)
+
+    def arrow(self, *args: Any, **kwargs: Any) -> Optional[ArrowTable]:
+        with self.cursor() as cursor:
+            return cursor.arrow(*args, **kwargs)
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        with self.cursor() as cursor:
+            return cursor.fetchall()
+
+    def fetchmany(self, chunk_size: int) -> List[Tuple[Any, ...]]:
+        with self.cursor() as cursor:
+            return cursor.fetchmany(chunk_size)
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        with self.cursor() as cursor:
+            return cursor.fetchone()
+
+    def iter_df(self, *args: Any, **kwargs: Any) -> Generator[DataFrame, None, None]:
+        with self.cursor() as cursor:
+            yield from cursor.iter_df(*args, **kwargs)
+
+    def iter_arrow(self, *args: Any, **kwargs: Any) -> Generator[ArrowTable, None, None]:
+        with self.cursor() as cursor:
+            yield from cursor.iter_arrow(*args, **kwargs)
+
+    def iter_fetch(self, chunk_size: int) -> Generator[List[Tuple[Any, ...]], Any, Any]:
+        with self.cursor() as cursor:
+            yield from cursor.iter_fetch(chunk_size)
+
+    def iter_arrow_prefetch(
+        self, chunk_size: int, prefetch: int = 2
+    ) -> Generator[ArrowTable, None, None]:
+        """Iterates over arrow tables of `chunk_size` items like `iter_arrow` but fetches up to
+        `prefetch` tables ahead in a background thread so reading from the destination overlaps
+        with processing of the yielded tables.
+
+        NOTE: tables are fetched over a dedicated connection that is opened, used and closed only
+        by the background thread so the dataset connection may be used while iterating.
+        """
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be a positive number of tables, got {prefetch}")
+        # resolve query, schema and client in the calling thread
+        self._dataset._ensure_client_and_schema()
+        query = self.query
+        columns_schema = self.columns_schema
+        sql_client = self._dataset._create_sql_client()
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def _put(item: Any) -> bool:
+            # retry until there's room in the queue or the consumer went away
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _produce() -> None:
+            try:
+                with sql_client as client:
+                    self._dataset._disable_autocommit(client)
+                    with client.execute_query(query) as cursor:
+                        if columns_schema:
+                            cursor.columns_schema = columns_schema
+                        for table in cursor.iter_arrow(chunk_size=chunk_size):
+                            if not _put(table):
+                                return
+            except BaseException as ex:
+                _put(ex)
+                return
+            _put(_PREFETCH_DONE)
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _PREFETCH_DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # stop the producer, it closes its connection when done
+            stop.set()
+            producer.join()
 
     def __copy__(self) -> "ReadableDBAPIRelation":
         return self.__class__(
@@ -208,9 +336,10 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
             raise ReadableRelationHasQueryException("select")
         rel = self.__copy__()
         rel._selected_columns = columns
+        rel._normalize_identifiers()
         # NOTE: the line below will ensure that no unknown columns are selected if
-        # schema is known
-        rel.compute_columns_schema()
+        # schema is known, the result is kept so cursors do not compute it again
+        rel._columns_schema_cache = rel.compute_columns_schema()
         return rel
 
     def __getitem__(self, columns: Union[str, Sequence[str]]) -> "SupportsReadableRelation":
@@ -228,6 +357,17 @@ class ReadableDBAPIRelation(SupportsReadableRelation):
 class ReadableDBAPIDataset(SupportsReadableDataset):
     """Access to dataframes and arrowtables in the destination dataset via dbapi"""
 
+    __slots__ = (
+        "_destination",
+        "_provided_schema",
+        "_dataset_name",
+        "_sql_client",
+        "_schema",
+        "_open_count",
+        "_open_client",
+        "_table_cache",
+    )
+
     def __init__(
         self,
         destination: TDestinationReferenceArg,
@@ -239,6 +379,11 @@ class ReadableDBAPIDataset(SupportsReadableDataset):
         self._dataset_name = dataset_name
         self._sql_client: SqlClientBase[Any] = None
         self._schema: Schema = None
+        # number of active `connection()` scopes sharing the open sql client connection
+        self._open_count: int = 0
+        self._open_client: SqlClientBase[Any] = None
+        # relations do not change after creation so they can be shared
+        self._table_cache: Dict[str, ReadableDBAPIRelation] = {}
 
     def ibis(self) -> IbisBackend:
         """return a connected ibis backend"""
@@ -260,6 +405,75 @@ class ReadableDBAPIDataset(SupportsReadableDataset):
         self._ensure_client_and_schema()
         return self._sql_client
 
+    @contextmanager
+    def connection(self) -> Generator["ReadableDBAPIDataset", Any, Any]:
+        """Keeps a single connection open for all relations of this dataset used within the context
+
+        Example:
+            with dataset.connection():
+                items_df = dataset.items.df()
+                other_items_df = dataset.other_items.df()
+
+        NOTE: all queries in the scope run on the same connection. On some destinations (ie. duckdb)
+        a new query discards the pending results of a previous one, so do not run other queries
+        while iterating over a relation (ie. with `iter_df`) within the scope.
+        """
+        if self._open_count == 0:
+            client = self.sql_client
+            client.open_connection()
+            self._open_client = client
+        self._open_count += 1
+        try:
+            yield self
+        finally:
+            self._open_count -= 1
+            if self._open_count == 0:
+                client, self._open_client = self._open_client, None
+                client.close_connection()
+
+    def fetch_many_relations(
+        self,
+        relations: Sequence[ReadableDBAPIRelation],
+        method: TRelationFetchMethod = "arrow",
+        *args: Any,
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+        """Executes queries of `relations` one after another over a single connection and yields
+        the result of relation `method` (ie. `arrow`, `df` or `fetchall`) for each of them
+
+        Example:
+            items, other_items = dataset.fetch_many_relations(
+                [dataset.items, dataset.other_items.head()], "df"
+            )
+        """
+        for relation in relations:
+            if relation._dataset is not self:
+                raise ReadableRelationDatasetMismatchException()
+        with self.connection():
+            for relation in relations:
+                yield getattr(relation, method)(*args, **kwargs)
+
+    @contextmanager
+    def _acquire_client(self) -> Generator[SqlClientBase[Any], Any, Any]:
+        """Yields sql client with an open connection. Inside of `connection()` scope the open
+        connection is shared, otherwise each call opens and closes its own connection"""
+        if self._open_client is not None:
+            yield self._open_client
+        else:
+            with self.sql_client as client:
+                yield client
+
+    @staticmethod
+    def _disable_autocommit(client: SqlClientBase[Any]) -> None:
+        # this hacky code is needed for mssql to disable autocommit, read iterators
+        # will not work otherwise. in the future we should be able to create a readony
+        # client which will do this automatically
+        # NOTE: checked for each cursor as transactions may enable autocommit again (mssql does),
+        # setting it is skipped if already disabled as it may require a round trip for some drivers
+        conn = getattr(client, "_conn", None)
+        if getattr(conn, "autocommit", False):
+            conn.autocommit = False
+
     def _destination_client(self, schema: Schema) -> JobClientBase:
         return get_destination_clients(
             schema, destination=self._destination, destination_dataset_name=self._dataset_name
@@ -296,23 +510,28 @@ class ReadableDBAPIDataset(SupportsReadableDataset):
 
         # here we create the client bound to the resolved schema
         if not self._sql_client:
-            destination_client = self._destination_client(self._schema)
-            if isinstance(destination_client, WithSqlClient):
-                self._sql_client = destination_client.sql_client
-            else:
-                raise Exception(
-                    f"Destination {destination_client.config.destination_type} does not support"
-                    " SqlClient."
-                )
+            self._sql_client = self._create_sql_client()
+
+    def _create_sql_client(self) -> SqlClientBase[Any]:
+        """Creates a new sql client bound to the resolved schema, with its own connection"""
+        destination_client = self._destination_client(self._schema)
+        if isinstance(destination_client, WithSqlClient):
+            return destination_client.sql_client
+        raise Exception(
+            f"Destination {destination_client.config.destination_type} does not support SqlClient."
+        )
 
     def __call__(self, query: Any) -> ReadableDBAPIRelation:
-        return ReadableDBAPIRelation(readable_dataset=self, provided_query=query)  # type: ignore[abstract]
+        return ReadableDBAPIRelation(readable_dataset=self, provided_query=query)
 
     def table(self, table_name: str) -> SupportsReadableRelation:
-        return ReadableDBAPIRelation(
-            readable_dataset=self,
-            table_name=table_name,
-        )  # type: ignore[abstract]
+        relation = self._table_cache.get(table_name)
+        if relation is None:
+            relation = self._table_cache[table_name] = ReadableDBAPIRelation(
+                readable_dataset=self,
+                table_name=table_name,
+            )
+        return relation
 
     def __getitem__(self, table_name: str) -> SupportsReadableRelation:
         """access of table via dict notation"""
@@ -320,8 +539,20 @@ class ReadableDBAPIDataset(SupportsReadableDataset):
 
     def __getattr__(self, table_name: str) -> SupportsReadableRelation:
         """access of table via property notation"""
+        # private and dunder names are never tables, this prevents introspection, copy and pickle
+        # from resolving the schema. use dict notation to access ie. dlt tables in that case
+        if table_name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{table_name}'")
         return self.table(table_name)
 
+    def __dir__(self) -> Iterable[str]:
+        """advertise tables known in the schema for property notation ie. for autocompletion"""
+        # do not resolve the schema here, introspection must not connect to the destination
+        if self._schema is None:
+            return super().__dir__()
+        tables = [name for name in self._schema.tables if not name.startswith("_")]
+        return [*super().__dir__(), *tables]
+
 
 def dataset(
     destination: TDestinationReferenceArg,
@@ -1,8 +1,14 @@
 """Unit tests for readable db api dataset and relation"""
+
+import threading
+from typing import cast
+
 import dlt
 import pytest
 
 from dlt.destinations.dataset import (
+    ReadableDBAPIDataset,
+    ReadableRelationDatasetMismatchException,
     ReadableRelationHasQueryException,
     ReadableRelationUnknownColumnException,
 )
@@ -54,6 +60,38 @@ def test_query_builder() -> None:
     )
 
 
+def test_query_is_cached() -> None:
+    dataset = dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset()
+    relation = dataset.my_table
+
+    # query is built once and reused
+    query = relation.query  # type: ignore[attr-defined]
+    assert relation._query_cache == query  # type: ignore[attr-defined]
+    assert relation.query is query  # type: ignore[attr-defined]
+
+    # derived relations build their own query
+    limited = relation.limit(10)
+    assert limited._query_cache is None  # type: ignore[attr-defined]
+    assert limited.query.strip() == 'SELECT  * FROM "pipeline_dataset"."my_table" LIMIT 10'  # type: ignore[attr-defined]
+    assert relation.query is query  # type: ignore[attr-defined]
+
+
+def test_table_relations_are_shared() -> None:
+    dataset = cast(
+        ReadableDBAPIDataset,
+        dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset(),
+    )
+
+    # all access notations return the same relation for a table
+    assert dataset.items is dataset.items
+    assert dataset["items"] is dataset.items
+    assert dataset.table("items") is dataset.items
+    assert dataset.other_items is not dataset.items
+
+    # derived relations are not shared
+    assert dataset.items.limit(5) is not dataset.items.limit(5)
+
+
 def test_copy_and_chaining() -> None:
     dataset = dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset()
 
@@ -61,7 +99,7 @@ def test_copy_and_chaining() -> None:
     relation = dataset.items
     relation = relation.limit(34)
     relation = relation[["one", "two"]]
-    relation._schema_columns = {"one": {}, "two": {}}  # type: ignore[attr-defined]
+    relation._columns_schema_cache = {"one": {}, "two": {}}  # type: ignore[attr-defined]
 
     relation2 = relation.__copy__()
     assert relation != relation2
@@ -75,6 +113,10 @@ def test_copy_and_chaining() -> None:
     assert relation2 != relation3
     assert relation2._limit != relation3._limit  # type: ignore[attr-defined]
 
+    # relations have fixed attributes
+    with pytest.raises(AttributeError):
+        relation._schema_columns = {"one": {}, "two": {}}  # type: ignore[attr-defined]
+
     # test last setting prevails chaining
     assert relation.limit(23).limit(67).limit(11)._limit == 11  # type: ignore[attr-defined]
 
@@ -101,6 +143,9 @@ def test_computed_schema_columns() -> None:
     # when selecting only one column, computing schema columns will only show that one
     assert relation.select("one").columns_schema == {"one": {"data_type": "text"}}
 
+    # table and column names are normalized before the schema lookup
+    assert dataset["ITEMS"].select("ONE").columns_schema == {"one": {"data_type": "text"}}
+
     # selecting unkonwn column fails
     with pytest.raises(ReadableRelationUnknownColumnException):
         relation["unknown_columns"]
@@ -118,3 +163,136 @@ def test_prevent_changing_relation_with_query() -> None:
 
     with pytest.raises(ReadableRelationHasQueryException):
         relation.select("hello", "hillo")
+
+
+def test_connection_reuse() -> None:
+    dataset = cast(
+        ReadableDBAPIDataset,
+        dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset(),
+    )
+
+    with dataset.connection():
+        conn = dataset.sql_client.native_connection
+        assert conn is not None
+        assert dataset("SELECT 1").fetchall() == [(1,)]
+        # nested acquisition shares the open connection
+        with dataset.connection():
+            assert dataset("SELECT 2").fetchone() == (2,)
+        assert dataset.sql_client.native_connection is conn
+        assert dataset._open_count == 1
+
+    # connection is closed when last context exits
+    assert dataset._open_count == 0
+    assert dataset.sql_client.native_connection is None
+
+
+def test_query_while_iterating() -> None:
+    dataset = dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset()
+    relation = dataset("SELECT * FROM range(10) t(id)")
+
+    # queries outside of `connection()` scope do not share the connection with open iterators
+    rows = []
+    for chunk in relation.iter_fetch(3):
+        assert dataset("SELECT 1").fetchall() == [(1,)]
+        rows.extend(chunk)
+    assert rows == [(i,) for i in range(10)]
+
+    # two iterators may be consumed together
+    pairs = list(zip(relation.iter_fetch(5), dataset("SELECT 42").iter_fetch(5)))
+    assert pairs == [([(i,) for i in range(5)], [(42,)])]
+
+
+def test_columns_schema_is_cached() -> None:
+    dataset = dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset()
+    relation = dataset.items
+
+    # unknown table is not cached
+    assert relation.columns_schema is None
+    dataset.schema.tables["items"] = {"columns": {"one": {"data_type": "text"}}}
+    columns_schema = relation.columns_schema
+    assert columns_schema == {"one": {"data_type": "text"}}
+
+    # known table is computed only once
+    assert relation._columns_schema_cache is columns_schema  # type: ignore[attr-defined]
+    assert relation.columns_schema is columns_schema
+
+    # select keeps the columns schema computed during validation
+    selected = relation.select("one")
+    assert selected._columns_schema_cache == {"one": {"data_type": "text"}}  # type: ignore[attr-defined]
+
+    # copies compute their own columns schema
+    assert relation.__copy__()._columns_schema_cache is None  # type: ignore[attr-defined]
+
+
+def test_fetch_many_relations() -> None:
+    dataset = cast(
+        ReadableDBAPIDataset,
+        dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset(),
+    )
+
+    results = dataset.fetch_many_relations([dataset("SELECT 1"), dataset("SELECT 2")], "fetchall")
+    assert list(results) == [[(1,)], [(2,)]]
+    # connection is released when all relations are fetched
+    assert dataset._open_count == 0
+
+    results = dataset.fetch_many_relations([dataset("SELECT 1 UNION ALL SELECT 2")], "fetchmany", 1)
+    assert list(results) == [[(1,)]]
+
+    # relations of other datasets are rejected
+    other_dataset = cast(
+        ReadableDBAPIDataset,
+        dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset(),
+    )
+    with pytest.raises(ReadableRelationDatasetMismatchException):
+        list(dataset.fetch_many_relations([other_dataset("SELECT 1")]))
+
+
+def test_iter_arrow_prefetch() -> None:
+    pytest.importorskip("pyarrow")
+    dataset = cast(
+        ReadableDBAPIDataset,
+        dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset(),
+    )
+    relation = dataset("SELECT * FROM range(10) t(id)")
+
+    tables = []
+    with dataset.connection():
+        for table in relation.iter_arrow_prefetch(chunk_size=3, prefetch=1):
+            # dataset connection is not used by the prefetching thread
+            assert dataset("SELECT 1").fetchall() == [(1,)]
+            tables.append(table)
+    assert sum(t.num_rows for t in tables) == 10
+
+    # producer thread is stopped when consumer stops early
+    threads = set(threading.enumerate())
+    tables_iter = relation.iter_arrow_prefetch(chunk_size=1, prefetch=1)
+    assert next(tables_iter).num_rows == 1
+    assert len(set(threading.enumerate()) - threads) == 1
+    tables_iter.close()
+    assert set(threading.enumerate()) - threads == set()
+
+    with pytest.raises(ValueError):
+        next(relation.iter_arrow_prefetch(chunk_size=1, prefetch=0))
+
+
+def test_attribute_access() -> None:
+    dataset = dlt.pipeline(destination="duckdb", pipeline_name="pipeline")._dataset()
+
+    # introspection does not resolve the schema
+    assert "table" in dir(dataset)
+    assert dataset._schema is None
+
+    # private and dunder names are not tables
+    with pytest.raises(AttributeError):
+        dataset._dlt_loads
+    with pytest.raises(AttributeError):
+        dataset.__wrapped__
+    # but tables starting with underscore are available with dict notation
+    assert dataset["_dlt_loads"].query.strip() == 'SELECT  * FROM "pipeline_dataset"."_dlt_loads"'  # type: ignore[attr-defined]
+
+    # known tables are listed next to regular attributes
+    dataset.schema.tables["items"] = {"columns": {"one": {"data_type": "text"}}}
+    attributes = dir(dataset)
+    assert "items" in attributes
+    assert "table" in attributes
+    assert "_dlt_loads" not in attributes
@@ -21,7 +21,11 @@ from tests.load.utils import (
 from dlt.destinations import filesystem
 from tests.utils import TEST_STORAGE_ROOT, clean_test_storage
 from dlt.common.destination.reference import TDestinationReferenceArg
-from dlt.destinations.dataset import ReadableDBAPIDataset, ReadableRelationUnknownColumnException
+from dlt.destinations.dataset import (
+    ReadableDBAPIDataset,
+    ReadableDBAPIRelation,
+    ReadableRelationUnknownColumnException,
+)
 from tests.load.utils import drop_pipeline_data
 
 EXPECTED_COLUMNS = ["id", "decimal", "other_decimal", "_dlt_load_id", "_dlt_id"]
@@ -182,6 +186,14 @@ def test_arrow_access(populated_pipeline: Pipeline) -> None:
     ids = reduce(lambda a, b: a + b, [t.column(EXPECTED_COLUMNS[0]).to_pylist() for t in tables])
     assert set(ids) == set(range(total_records))
 
+    # prefetched tables are the same as iterated ones
+    tables = list(
+        cast(ReadableDBAPIRelation, table_relationship).iter_arrow_prefetch(
+            chunk_size=chunk_size, prefetch=1
+        )
+    )
+    assert [t.num_rows for t in tables] == expected_chunk_counts
+
 
 @pytest.mark.no_load
 @pytest.mark.essential